@@ -1,18 +1,13 @@
 import streamlit as st
-import asyncio
-import os
+import threading
+import uuid
 from pathlib import Path
 import sys
-import nest_asyncio
-
-# Apply nest_asyncio to allow nested event loops
-nest_asyncio.apply()
 
 # Add backend to path
 sys.path.append(str(Path(__file__).parent / 'backend'))
 
-from qa_service import qa_service
-from data_service import data_service
+from event_loop import run_async
 
 # Set page config
 st.set_page_config(
@@ -25,15 +20,57 @@ st.set_page_config(
 if 'messages' not in st.session_state:
     st.session_state.messages = []
 if 'session_id' not in st.session_state:
-    st.session_state.session_id = f"session_{hash(str(st.session_state))}"
+    st.session_state.session_id = f"session_{uuid.uuid4().hex}"
+
+class SessionStats:
+    """Process-wide record of the sessions sharing the loaded data"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sessions = set()
+        self.data_service_inits = 0
+
+    def register_session(self, session_id: str):
+        with self._lock:
+            self.sessions.add(session_id)
+
+    def record_data_service_init(self):
+        with self._lock:
+            self.data_service_inits += 1
+
+@st.cache_resource
+def get_session_stats() -> SessionStats:
+    return SessionStats()
+
+@st.cache_resource
+def get_data_service():
+    """Load the datasets once per process and share them across all sessions"""
+    from data_service import data_service
+    get_session_stats().record_data_service_init()
+    # Build the summary here so neither reruns nor the event loop pay for it
+    data_service.get_data_summary()
+    return data_service
+
+@st.cache_resource
+def get_qa_service():
+    """Create the Gemini client once per process"""
+    get_data_service()
+    from qa_service import qa_service
+    return qa_service
 
 def main():
     # Header
     st.title("🌾 Project Samarth")
     st.subheader("Intelligent Q&A System for Agricultural & Climate Data")
 
+    stats = get_session_stats()
+    stats.register_session(st.session_state.session_id)
+
     # Data summary
+    dataset_loads = "N/A"
     try:
+        data_service = get_data_service()
+        from data_service import DataService
+        dataset_loads = DataService.load_count
         data_summary = data_service.get_data_summary()
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -46,6 +83,12 @@ def main():
     except Exception as e:
         st.error(f"Error loading data summary: {e}")
 
+    with st.sidebar:
+        st.markdown("#### Performance")
+        st.metric("Sessions served", len(stats.sessions))
+        st.metric("Data service inits", stats.data_service_inits)
+        st.metric("Dataset loads", dataset_loads)
+
     # Sample questions
     sample_questions = [
         "Compare average annual rainfall in Maharashtra and Karnataka for the last 10 years",
@@ -89,10 +132,9 @@ def main():
         # Show loading
         with st.spinner("Analyzing data and generating response..."):
             try:
-                # Get answer (qa_service.analyze_question is async, but we'll run it synchronously)
-                import nest_asyncio
-                nest_asyncio.apply()
-                result = asyncio.run(qa_service.analyze_question(prompt, st.session_state.session_id))
+                # Get answer on the process-wide event loop (qa_service.analyze_question is async)
+                qa_service = get_qa_service()
+                result = run_async(qa_service.analyze_question(prompt, st.session_state.session_id))
 
                 # Add assistant message
                 st.session_state.messages.append({
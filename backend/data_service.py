@@ -7,40 +7,72 @@ from typing import Dict, Any, List
 logger = logging.getLogger(__name__)
 
 class DataService:
+    # Number of times any instance has read the datasets from disk
+    load_count = 0
+    
     def __init__(self):
         self.data_dir = Path(__file__).parent / 'data'
         self.crop_df = None
         self.rainfall_df = None
         self.social_df = None
+        self.data_version = None
+        self._summary_cache = None
         self.load_data()
     
     def load_data(self):
         """Load all datasets into memory"""
         try:
+            loaded_files = []
+            
             # Load crop production data
             crop_path = self.data_dir / 'crop_production.csv'
             if crop_path.exists():
                 self.crop_df = pd.read_csv(crop_path)
+                loaded_files.append(crop_path)
                 logger.info(f"Loaded crop data: {self.crop_df.shape[0]} rows")
             
             # Load rainfall data
             rainfall_path = self.data_dir / 'rainfall.xls'
             if rainfall_path.exists():
                 self.rainfall_df = pd.read_excel(rainfall_path)
+                loaded_files.append(rainfall_path)
                 logger.info(f"Loaded rainfall data: {self.rainfall_df.shape[0]} rows")
             
             # Load social groups data
             social_path = self.data_dir / 'social_groups.csv'
             if social_path.exists():
                 self.social_df = pd.read_csv(social_path)
+                loaded_files.append(social_path)
                 logger.info(f"Loaded social groups data: {self.social_df.shape[0]} rows")
             
+            self.data_version = self._compute_version(loaded_files)
+            self._summary_cache = None
+            DataService.load_count += 1
+            
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             raise
     
+    @staticmethod
+    def _compute_version(paths: List[Path]) -> str:
+        """Build a version key from the name, size and mtime of each loaded file"""
+        parts = []
+        for path in paths:
+            stat = path.stat()
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return '|'.join(parts)
+    
     def get_data_summary(self) -> Dict[str, Any]:
-        """Get summary statistics of available datasets"""
+        """Get summary statistics of available datasets, memoized by data version"""
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self.data_version:
+            return cached[1]
+        
+        summary = self._build_data_summary()
+        self._summary_cache = (self.data_version, summary)
+        return summary
+    
+    def _build_data_summary(self) -> Dict[str, Any]:
         summary = {}
         
         if self.crop_df is not None:
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import logging
+from typing import Any, Coroutine, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a caller waits for a coroutine on the background loop
+DEFAULT_TIMEOUT_SECONDS = 120
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+def start_background_loop() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    """Start a long-lived event loop running in a daemon thread"""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="samarth-event-loop", daemon=True)
+    thread.start()
+    return loop, thread
+
+def stop_background_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread):
+    """Stop a loop started by start_background_loop, wait for its thread and close it"""
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Process-wide event loop, created on first use.
+    It lives next to the qa_service/data_service singletons so clients bound to it
+    (e.g. the Gemini gRPC channel) are never used from a different loop.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop, _ = start_background_loop()
+        return _loop
+
+def run_async(coro: Coroutine[Any, Any, Any], loop: Optional[asyncio.AbstractEventLoop] = None,
+              timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Any:
+    """
+    Run a coroutine on the background loop and wait for its result.
+    The coroutine is cancelled if it does not finish within timeout seconds.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, loop or get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        # The coroutine itself raised TimeoutError; keep its traceback
+        if future.done():
+            raise
+        future.cancel()
+        logger.error(f"Coroutine timed out after {timeout} seconds")
+        raise TimeoutError(f"Request timed out after {timeout} seconds") from None
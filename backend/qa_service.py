@@ -1,4 +1,5 @@
 import google.generativeai as genai
+import asyncio
 import os
 import json
 import logging
@@ -28,7 +29,7 @@ class QAService:
         Analyze user question and generate answer using LLM with data context
         """
         try:
-            # Get data summary for context
+            # Get data summary for context (memoized on the data service)
             data_summary = data_service.get_data_summary()
             
             # Create system message with data context
@@ -130,48 +131,57 @@ After receiving data, provide a natural language answer that:
         results = {}
         
         for i, request in enumerate(requests):
-            req_type = request.get('type')
-            filters = request.get('filters', {})
+            # pandas filtering is blocking, so keep it off the shared event loop
+            results.update(await asyncio.to_thread(self._execute_data_request, i, request))
+        
+        return results
+    
+    def _execute_data_request(self, i: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a single data request against the loaded datasets"""
+        results = {}
+        
+        req_type = request.get('type')
+        filters = request.get('filters', {})
+        
+        try:
+            if req_type == 'crop_production':
+                df = data_service.query_crop_data(filters)
+                if not df.empty:
+                    # Aggregate data for summary
+                    summary = {
+                        'total_rows': len(df),
+                        'states': df['State_Name'].unique().tolist(),
+                        'crops': df['Crop'].unique().tolist(),
+                        'year_range': [int(df['Crop_Year'].min()), int(df['Crop_Year'].max())],
+                        'total_production': float(df['Production'].sum()),
+                        'total_area': float(df['Area'].sum()),
+                        'top_crops_by_production': df.groupby('Crop')['Production'].sum().sort_values(ascending=False).head(10).to_dict(),
+                        'production_by_year': df.groupby('Crop_Year')['Production'].sum().to_dict(),
+                        'districts': df['District_Name'].unique().tolist()[:20]
+                    }
+                    results[f'crop_data_{i}'] = summary
+                else:
+                    results[f'crop_data_{i}'] = {'error': 'No data found for given filters'}
             
-            try:
-                if req_type == 'crop_production':
-                    df = data_service.query_crop_data(filters)
-                    if not df.empty:
-                        # Aggregate data for summary
-                        summary = {
-                            'total_rows': len(df),
-                            'states': df['State_Name'].unique().tolist(),
-                            'crops': df['Crop'].unique().tolist(),
-                            'year_range': [int(df['Crop_Year'].min()), int(df['Crop_Year'].max())],
-                            'total_production': float(df['Production'].sum()),
-                            'total_area': float(df['Area'].sum()),
-                            'top_crops_by_production': df.groupby('Crop')['Production'].sum().sort_values(ascending=False).head(10).to_dict(),
-                            'production_by_year': df.groupby('Crop_Year')['Production'].sum().to_dict(),
-                            'districts': df['District_Name'].unique().tolist()[:20]
-                        }
-                        results[f'crop_data_{i}'] = summary
-                    else:
-                        results[f'crop_data_{i}'] = {'error': 'No data found for given filters'}
-                
-                elif req_type == 'rainfall':
-                    df = data_service.query_rainfall_data(filters)
-                    if not df.empty:
-                        summary = {
-                            'total_rows': len(df),
-                            'subdivisions': df['SD_Name'].unique().tolist(),
-                            'year_range': [int(df['YEAR'].min()), int(df['YEAR'].max())],
-                            'average_annual_rainfall': float(df['ANNUAL'].mean()),
-                            'min_rainfall': float(df['ANNUAL'].min()),
-                            'max_rainfall': float(df['ANNUAL'].max()),
-                            'rainfall_by_year': df.groupby('YEAR')['ANNUAL'].mean().to_dict()
-                        }
-                        results[f'rainfall_data_{i}'] = summary
-                    else:
-                        results[f'rainfall_data_{i}'] = {'error': 'No data found for given filters'}
-                
-            except Exception as e:
-                logger.error(f"Error executing data request: {e}")
-                results[f'error_{i}'] = str(e)
+            elif req_type == 'rainfall':
+                df = data_service.query_rainfall_data(filters)
+                if not df.empty:
+                    summary = {
+                        'total_rows': len(df),
+                        'subdivisions': df['SD_Name'].unique().tolist(),
+                        'year_range': [int(df['YEAR'].min()), int(df['YEAR'].max())],
+                        'average_annual_rainfall': float(df['ANNUAL'].mean()),
+                        'min_rainfall': float(df['ANNUAL'].min()),
+                        'max_rainfall': float(df['ANNUAL'].max()),
+                        'rainfall_by_year': df.groupby('YEAR')['ANNUAL'].mean().to_dict()
+                    }
+                    results[f'rainfall_data_{i}'] = summary
+                else:
+                    results[f'rainfall_data_{i}'] = {'error': 'No data found for given filters'}
+            
+        except Exception as e:
+            logger.error(f"Error executing data request: {e}")
+            results[f'error_{i}'] = str(e)
         
         return results
     
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make backend modules importable the same way app.py does
+sys.path.append(str(Path(__file__).parent.parent))
@@ -0,0 +1,58 @@
+import os
+
+from data_service import DataService
+
+
+def _write(path, content):
+    path.write_text(content)
+    return path
+
+
+def test_data_version_is_stable_for_unchanged_files(tmp_path):
+    crop = _write(tmp_path / 'crop_production.csv', 'a,b\n1,2\n')
+    social = _write(tmp_path / 'social_groups.csv', 'x\n1\n')
+
+    assert DataService._compute_version([crop, social]) == DataService._compute_version([crop, social])
+
+
+def test_data_version_changes_with_file_size(tmp_path):
+    crop = _write(tmp_path / 'crop_production.csv', 'a,b\n1,2\n')
+    before = DataService._compute_version([crop])
+    stat = crop.stat()
+
+    crop.write_text('a,b\n1,2\n3,4\n')
+    # Keep the mtime fixed so only the size differs
+    os.utime(crop, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert DataService._compute_version([crop]) != before
+
+
+def test_data_version_changes_with_file_mtime(tmp_path):
+    crop = _write(tmp_path / 'crop_production.csv', 'a,b\n1,2\n')
+    before = DataService._compute_version([crop])
+    stat = crop.stat()
+
+    os.utime(crop, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert DataService._compute_version([crop]) != before
+
+
+def test_data_summary_is_memoized_by_version():
+    service = DataService()
+    loads = DataService.load_count
+
+    first = service.get_data_summary()
+    assert service.get_data_summary() is first
+
+    service.data_version = 'changed'
+    assert service.get_data_summary() is not first
+    assert DataService.load_count == loads
+
+
+def test_load_data_counts_each_load():
+    service = DataService()
+    loads = DataService.load_count
+
+    service.load_data()
+
+    assert DataService.load_count == loads + 1
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from event_loop import start_background_loop, stop_background_loop, get_loop, run_async
+
+
+@pytest.fixture
+def loop():
+    loop, thread = start_background_loop()
+    yield loop
+    stop_background_loop(loop, thread)
+
+
+def test_run_async_returns_result(loop):
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run_async(add(2, 3), loop) == 5
+
+
+def test_run_async_propagates_exception(loop):
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_async(fail(), loop)
+
+
+def test_run_async_keeps_timeout_raised_by_coroutine(loop):
+    async def fail_fast():
+        raise TimeoutError("upstream timeout")
+
+    with pytest.raises(TimeoutError, match="upstream timeout"):
+        run_async(fail_fast(), loop, timeout=30)
+
+
+def test_run_async_cancels_on_timeout(loop):
+    cancelled = asyncio.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        run_async(hang(), loop, timeout=0.1)
+
+    async def wait_cancelled():
+        await asyncio.wait_for(cancelled.wait(), timeout=5)
+        return True
+
+    assert run_async(wait_cancelled(), loop)
+
+
+def test_run_async_reuses_the_same_loop(loop):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_async(current_loop(), loop) is loop
+    assert run_async(current_loop(), loop) is loop
+
+
+def test_get_loop_returns_one_running_loop():
+    assert get_loop() is get_loop()
+    assert get_loop().is_running()